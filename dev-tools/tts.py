@@ -0,0 +1,594 @@
+
+#!/usr/bin/env python3
+"""
+Parametric Japanese/Spanish Text-to-Speech
+Single entry point over three backends: Coqui XTTS v2 (heavy, local),
+gTTS (lightweight, network-backed) and Piper (lightweight, local CPU).
+Backends are imported lazily so the light paths never pay the torch/TTS
+import cost, and each language's preprocessing lives here exactly once.
+"""
+
+import base64
+import hashlib
+import io
+import os
+import queue
+import re
+import sys
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import neologdn
+except ImportError:
+    # Optional C++ normalizer - the pure-Python NFKC path below still works
+    neologdn = None
+
+# ---------------------------------------------------------------------------
+# Text preprocessing
+# ---------------------------------------------------------------------------
+
+# Precompiled patterns - compiling once at import avoids re-parsing the
+# pattern on every call, which matters when preprocessing runs per-sentence.
+_BRACKET_SPANS = re.compile(r'\[.*?\]|【.*?】|\(.*?\)|（.*?）|\{.*?\}')
+_WS = re.compile(r'\s+')
+_JA_SENTENCE_SPLIT = re.compile(r'(?<=[。！？])\s*')
+_ES_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Japanese punctuation kept alongside the kana/kanji ranges
+_JA_PUNCTUATION = frozenset('。、！？・')
+
+# Allowed characters: Spanish alphabet, accented vowels, ñ/ü, and punctuation.
+# A frozenset membership test keeps the filter a tight C-level join/filter
+# loop instead of running the regex engine over every character.
+_ES_ALLOWED = frozenset(
+    'abcdefghijklmnopqrstuvwxyz'
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    "áéíóúñüÁÉÍÓÚÑÜ¿¡.,;:!?-'"
+)
+
+@lru_cache(maxsize=None)
+def _keep_ja(ch):
+    """
+    Return True if a character survives the Japanese keep-class filter:
+    hiragana (3040-309F), katakana (30A0-30FF), kanji (4E00-9FFF),
+    basic Japanese punctuation, and whitespace.
+    """
+    if ch in _JA_PUNCTUATION or ch.isspace():
+        return True
+    cp = ord(ch)
+    # 30FC is the long vowel mark (ー) - inside the katakana block but
+    # dropped here since it can be mispronounced by the TTS model
+    if cp == 0x30FC:
+        return False
+    return (0x3040 <= cp <= 0x309F
+            or 0x30A0 <= cp <= 0x30FF
+            or 0x4E00 <= cp <= 0x9FFF)
+
+def _keep_es(ch):
+    """Return True if a character survives the Spanish keep-class filter."""
+    return ch in _ES_ALLOWED or ch.isspace()
+
+def preprocess_japanese_text(text):
+    """
+    Preprocess Japanese text for TTS by:
+    - Normalizing text (neologdn when available, NFKC normalization otherwise)
+    - Removing brackets and their contents
+    - Removing long vowel marks (ー) that might be mispronounced (as part of
+      the keep-class filter, so the string is only walked once)
+    - Removing extra punctuation while keeping basic Japanese punctuation
+    - Keeping hiragana, katakana, kanji, and basic punctuation
+    """
+    # Fast path: already-normalized text whose characters all pass the
+    # keep-class filter and whose whitespace is collapsed would come out
+    # of every pass below unchanged - common when an upstream component
+    # pre-cleans its output - so skip the whole chain. With neologdn
+    # installed the chain also strips spaces between Japanese characters,
+    # so only whitespace-free text counts as clean there
+    if ((neologdn is None or not _WS.search(text))
+            and unicodedata.is_normalized('NFKC', text)
+            and all(map(_keep_ja, text))
+            and text == ' '.join(text.split())):
+        return text
+
+    # Normalize the text. neologdn does width folding, long-vowel-run
+    # shortening and whitespace collapsing in a single C++ pass; fall back
+    # to plain NFKC normalization when it is not installed. repeat is left
+    # at its default (no repeated-character shortening) so already-clean
+    # text yields the same output whether or not it took the fast path
+    if neologdn is not None:
+        text = neologdn.normalize(text)
+    elif not unicodedata.is_normalized('NFKC', text):
+        # Skip the normalizing pass (and its string copy) when already NFKC
+        text = unicodedata.normalize('NFKC', text)
+
+    # Remove bracketed spans in a single pass; the keep-class filter below
+    # catches any stray unmatched bracket characters
+    text = _BRACKET_SPANS.sub('', text)
+
+    # Remove unwanted symbols but keep Japanese punctuation; the cached
+    # per-character predicate keeps the filter a tight C-level join/filter
+    # loop instead of running the regex engine over every character
+    text = ''.join(filter(_keep_ja, text))
+
+    # Normalize whitespace
+    text = _WS.sub(' ', text).strip()
+
+    return text
+
+def preprocess_spanish_text(text):
+    """
+    Preprocess Spanish text for TTS by:
+    - Normalizing Unicode to NFKC form
+    - Removing brackets and their contents
+    - Removing unwanted symbols while keeping Spanish characters
+    - Keeping accented characters (á, é, í, ó, ú, ñ, ü)
+    - Keeping Spanish punctuation (¿, ¡, etc.)
+    """
+    # Fast path: already-normalized text whose characters all pass the
+    # keep-class filter and whose whitespace is collapsed would come out
+    # of every pass below unchanged - common when an upstream component
+    # pre-cleans its output - so skip the whole chain
+    if ((text.isascii() or unicodedata.is_normalized('NFKC', text))
+            and all(map(_keep_es, text))
+            and text == ' '.join(text.split())):
+        return text
+
+    # Normalize Unicode to NFKC (compatibility decomposition + canonical composition)
+    # ASCII text is NFKC by definition - common for Spanish input without accents -
+    # and already-normalized text needs no pass either, so skip the string copy
+    if not text.isascii() and not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
+
+    # Remove bracketed spans in a single pass; the keep-class filter below
+    # catches any stray unmatched bracket characters
+    text = _BRACKET_SPANS.sub('', text)
+
+    # Keep Spanish alphabet (a-z, A-Z), accented characters, ñ, and Spanish punctuation
+    # Keep: á é í ó ú ñ ü and their uppercase variants
+    # Keep: Spanish punctuation (¿ ¡ . , ; : ! ? - ')
+    text = ''.join(filter(_keep_es, text))
+
+    # Normalize whitespace
+    text = _WS.sub(' ', text).strip()
+
+    return text
+
+def preprocess_text(text, lang):
+    """Dispatch to the language's preprocessor ('ja' or 'es')."""
+    if lang == 'ja':
+        return preprocess_japanese_text(text)
+    return preprocess_spanish_text(text)
+
+def split_sentences(text, lang='es'):
+    """Split text into sentences on the language's terminal punctuation."""
+    pattern = _JA_SENTENCE_SPLIT if lang == 'ja' else _ES_SENTENCE_SPLIT
+    return [s for s in pattern.split(text) if s.strip()]
+
+# ---------------------------------------------------------------------------
+# Coqui XTTS v2 backend (heavy - torch/TTS imported lazily)
+# ---------------------------------------------------------------------------
+
+# XTTS v2 model singleton - constructing TTS() reloads several hundred MB of
+# weights on every call, so build it once and reuse it across syntheses.
+_tts_instance = None
+_tts_lock = threading.Lock()
+
+# On-disk cache for speaker-conditioning latents; computing them walks the
+# reference wav through the conditioning encoder on every call otherwise
+_LATENTS_CACHE_DIR = Path.home() / '.cache' / 'archimedes' / 'xtts'
+
+def _compile_gpt(tts):
+    """
+    Wrap the GPT decode step with torch.compile and warm it up.
+
+    reduce-overhead mode captures the fixed-shape decode graph (including
+    its KV cache) as a CUDA graph, cutting per-token decode cost 2-3x on
+    recent GPUs. Compilation itself takes tens of seconds, so it is opt-in
+    via ARCHIMEDES_TTS_COMPILE=1 - not worth paying for one-shot CLI runs.
+    """
+    import torch
+    gpt_inference = tts.synthesizer.tts_model.gpt.gpt_inference
+    # Compile the forward pass in place rather than wrapping the module:
+    # XTTS drives gpt_inference through HF generate()/generate_stream(),
+    # which a wrapping OptimizedModule would resolve back to the original
+    # module's bound methods, silently bypassing the compiled graph
+    gpt_inference.forward = torch.compile(
+        gpt_inference.forward, mode="reduce-overhead", fullgraph=False
+    )
+    # Warm up on a short utterance so the compile cost is paid at load
+    # time instead of on the first real synthesis
+    speakers = getattr(tts, "speakers", None)
+    if speakers:
+        tts.tts("warmup", language="en", speaker=speakers[0])
+
+def _get_tts():
+    """
+    Return the shared XTTS v2 instance, loading it lazily on first use.
+    Moves the model to GPU once if CUDA is available. torch and TTS are
+    imported here so the gTTS backend never pays for them.
+    """
+    global _tts_instance
+    if _tts_instance is None:
+        with _tts_lock:
+            if _tts_instance is None:
+                import torch
+                from TTS.api import TTS
+                tts = TTS(model_name="tts_models/multilingual/multi-dataset/xtts_v2", progress_bar=False)
+                if torch.cuda.is_available():
+                    tts.to("cuda")
+                    if os.environ.get('ARCHIMEDES_TTS_COMPILE') == '1':
+                        _compile_gpt(tts)
+                elif os.environ.get('ARCHIMEDES_TTS_INT8') == '1':
+                    # Experimental: dynamic int8 quantization of the GPT's
+                    # nn.Linear layers (text/mel heads). The transformer
+                    # blocks themselves use transformers' Conv1D, which
+                    # quantize_dynamic has no quantized counterpart for,
+                    # so the bulk of the decode stays fp32 and the gains
+                    # are modest
+                    tts.synthesizer.tts_model.gpt = torch.ao.quantization.quantize_dynamic(
+                        tts.synthesizer.tts_model.gpt, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                _tts_instance = tts
+    return _tts_instance
+
+def _get_conditioning_latents(tts, speaker_wav):
+    """
+    Return (gpt_cond_latent, speaker_embedding) for a reference wav.
+
+    Computed once per reference file and cached to disk keyed by the wav
+    path hash, so repeat speakers skip the conditioning encoder entirely.
+    """
+    import torch
+    model = tts.synthesizer.tts_model
+    device = next(model.parameters()).device
+    key = hashlib.sha1(os.path.abspath(speaker_wav).encode()).hexdigest()
+    cache_file = _LATENTS_CACHE_DIR / f'{key}.pt'
+    if cache_file.exists():
+        gpt_cond_latent, speaker_embedding = torch.load(cache_file, map_location=device)
+        return gpt_cond_latent, speaker_embedding
+    gpt_cond_latent, speaker_embedding = model.get_conditioning_latents(audio_path=speaker_wav)
+    _LATENTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    torch.save((gpt_cond_latent, speaker_embedding), cache_file)
+    return gpt_cond_latent, speaker_embedding
+
+def _xtts_to_file(tts, cleaned_text, language, output_file, speaker_wav):
+    """Write one utterance to output_file through the XTTS backend."""
+    if speaker_wav:
+        import soundfile as sf
+        # Low-level streaming path: reuse cached conditioning latents and
+        # write audio chunks to disk as the model decodes them, so
+        # time-to-first-audio is first-chunk latency rather than
+        # whole-utterance latency
+        gpt_cond_latent, speaker_embedding = _get_conditioning_latents(tts, speaker_wav)
+        chunks = tts.synthesizer.tts_model.inference_stream(
+            cleaned_text, language, gpt_cond_latent, speaker_embedding,
+            stream_chunk_size=20
+        )
+        sample_rate = tts.synthesizer.output_sample_rate
+        # Overlap the device-to-host copy and disk write of each chunk
+        # with the decode of the next one: the decode loop only enqueues
+        # tensors while a writer thread drains them to the WAV file. The
+        # file is opened here so open errors (missing directory, bad
+        # path) raise in the caller, and write errors are re-raised after
+        # join() rather than dying silently with the thread
+        write_queue = queue.Queue(maxsize=8)
+        write_errors = []
+        wav_file = sf.SoundFile(output_file, 'w', samplerate=sample_rate, channels=1)
+
+        def _drain():
+            try:
+                with wav_file:
+                    while True:
+                        chunk = write_queue.get()
+                        if chunk is None:
+                            return
+                        wav_file.write(chunk.squeeze().cpu().numpy())
+            except Exception as exc:
+                write_errors.append(exc)
+                # Keep consuming so the producer can't block on a full queue
+                while write_queue.get() is not None:
+                    pass
+
+        writer = threading.Thread(target=_drain)
+        writer.start()
+        try:
+            for chunk in chunks:
+                write_queue.put(chunk)
+        finally:
+            write_queue.put(None)
+            writer.join()
+        if write_errors:
+            raise write_errors[0]
+    else:
+        tts.tts_to_file(
+            text=cleaned_text,
+            file_path=output_file,
+            language=language
+        )
+
+def synthesize_to_buffer(text, lang='es', speaker_wav=None):
+    """
+    Synthesize speech with the XTTS backend and return it in memory as
+    (samples, sample_rate).
+
+    Skips the WAV round-trip through disk entirely; callers that play or
+    stream the audio never touch a file, and save_buffer() provides the
+    final file sink when one is needed. Returns None when no text remains
+    after preprocessing.
+    """
+    import numpy as np
+    cleaned_text = preprocess_text(text, lang)
+    if not cleaned_text:
+        return None
+    tts = _get_tts()
+    if speaker_wav:
+        gpt_cond_latent, speaker_embedding = _get_conditioning_latents(tts, speaker_wav)
+        out = tts.synthesizer.tts_model.inference(
+            cleaned_text, lang, gpt_cond_latent, speaker_embedding
+        )
+        wav = np.asarray(out['wav'], dtype=np.float32)
+    else:
+        wav = np.asarray(tts.tts(text=cleaned_text, language=lang), dtype=np.float32)
+    return wav, tts.synthesizer.output_sample_rate
+
+def save_buffer(wav, sample_rate, path):
+    """Write an in-memory waveform to a WAV file."""
+    import soundfile as sf
+    sf.write(path, wav, sample_rate)
+
+def synthesize_many(texts, out_paths, lang='es', speaker_wav=None):
+    """
+    Synthesize a batch of utterances through the shared XTTS model.
+
+    The model (and, for voice cloning, the speaker-conditioning latents)
+    are loaded once and reused for every utterance, so the fixed per-call
+    costs are amortized across the whole batch. Multi-sentence input can
+    be pre-split with split_sentences().
+
+    Args:
+        texts: List of strings to synthesize
+        out_paths: Output WAV path per utterance, same length as texts
+        lang: Language code passed to the model
+        speaker_wav: Optional reference wav for voice cloning
+    """
+    if len(texts) != len(out_paths):
+        raise ValueError("texts and out_paths must have the same length")
+    tts = _get_tts()
+    conditioning = None
+    if speaker_wav:
+        conditioning = _get_conditioning_latents(tts, speaker_wav)
+    for utterance, out_path in zip(texts, out_paths):
+        cleaned = preprocess_text(utterance, lang)
+        if not cleaned:
+            continue
+        if conditioning:
+            gpt_cond_latent, speaker_embedding = conditioning
+            out = tts.synthesizer.tts_model.inference(
+                cleaned, lang, gpt_cond_latent, speaker_embedding
+            )
+            tts.synthesizer.save_wav(wav=out['wav'], path=out_path)
+        else:
+            tts.tts_to_file(text=cleaned, file_path=out_path, language=lang)
+
+# ---------------------------------------------------------------------------
+# gTTS backend (lightweight - gtts/requests imported lazily)
+# ---------------------------------------------------------------------------
+
+# On-disk MP3 cache - screen-reader/chat workloads repeat the same short
+# phrases constantly, and a cache hit is a file read instead of a network
+# round-trip to the Google endpoint
+_GTTS_CACHE_DIR = Path.home() / '.cache' / 'archimedes' / 'gtts'
+
+_gtts_session = None
+_gtts_lock = threading.Lock()
+
+# gTTS's RPC responses wrap the base64 MP3 payload in a jQ1olc envelope;
+# this mirrors the response parsing in gTTS.stream()
+_GTTS_AUDIO = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+def _get_gtts_session():
+    """
+    Return the shared pooled HTTP session for gTTS calls, built once.
+
+    gTTS.stream() opens a fresh requests.Session per call, paying a
+    50-200 ms TCP/TLS handshake per phrase. One keep-alive session across
+    all calls avoids that, and retries transient endpoint errors with
+    backoff instead of failing the whole synthesis.
+    """
+    global _gtts_session
+    if _gtts_session is None:
+        with _gtts_lock:
+            if _gtts_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                session = requests.Session()
+                session.mount('https://', HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=4,
+                    max_retries=Retry(total=3, backoff_factor=0.3,
+                                      status_forcelist=(429, 500, 502, 503, 504)),
+                ))
+                _gtts_session = session
+    return _gtts_session
+
+def _fetch_mp3(text, lang, slow=False):
+    """
+    Return MP3 bytes for (text, lang), consulting the on-disk cache first.
+
+    Cache hits skip the HTTP request entirely; misses send gTTS's
+    prepared requests through the shared keep-alive session and store the
+    response under ~/.cache/archimedes/gtts keyed by a hash of
+    (lang, slow, text).
+    """
+    key = hashlib.sha1(f"{lang}|{slow}|{text}".encode()).hexdigest()
+    cache_file = _GTTS_CACHE_DIR / f'{key}.mp3'
+    if cache_file.exists():
+        return cache_file.read_bytes()
+    from gtts import gTTS
+    session = _get_gtts_session()
+    buf = io.BytesIO()
+    # gTTS's own write_to_fp would open a throwaway Session per call, so
+    # send its prepared requests through the pooled session and decode the
+    # audio payload the same way gTTS.stream() does
+    for prepared_request in gTTS(text=text, lang=lang, slow=slow)._prepare_requests():
+        response = session.send(prepared_request)
+        response.raise_for_status()
+        for line in response.iter_lines(chunk_size=1024):
+            match = _GTTS_AUDIO.search(line.decode('utf-8'))
+            if match:
+                buf.write(base64.b64decode(match.group(1).encode('ascii')))
+    data = buf.getvalue()
+    if not data:
+        # No audio envelope in any response (endpoint format drift, or an
+        # error page served with HTTP 200) - raising here keeps the blob
+        # out of the cache, which would otherwise serve the poisoned
+        # zero-byte MP3 for this phrase forever
+        raise RuntimeError(f"gTTS returned no audio for {text!r} (lang={lang})")
+    _GTTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(data)
+    return data
+
+def synthesize_all(texts, lang='es', max_workers=8):
+    """
+    Synthesize several utterances concurrently to out_<i>.mp3 files
+    through the gTTS backend.
+
+    gTTS is I/O-bound on the Google endpoint, so a thread pool overlaps
+    the network waits and wall-clock time is set by the slowest request
+    rather than their sum. Returns the list of output files written.
+    """
+    output_files = [f'out_{i}.mp3' for i in range(len(texts))]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(synthesize, text, lang, 'gtts', output_file)
+                   for text, output_file in zip(texts, output_files)]
+        for future in futures:
+            future.result()
+    return output_files
+
+# ---------------------------------------------------------------------------
+# Piper backend (lightweight local CPU - piper imported lazily)
+# ---------------------------------------------------------------------------
+
+# Per-language voice cache - Piper voices are small ONNX models that load
+# in well under a second, but reloading per call would still dominate the
+# 30-100 ms synthesis cost
+_piper_voices = {}
+_piper_lock = threading.Lock()
+
+def _get_piper_voice(lang):
+    """
+    Return the cached PiperVoice for a language, loading it on first use.
+
+    The voice model path comes from ARCHIMEDES_PIPER_VOICE_JA /
+    ARCHIMEDES_PIPER_VOICE_ES; Piper voices are per-language .onnx files
+    (tens of MB) downloaded separately from the piper-tts releases.
+    """
+    if lang not in _piper_voices:
+        with _piper_lock:
+            if lang not in _piper_voices:
+                from piper import PiperVoice
+                model_path = os.environ.get(f'ARCHIMEDES_PIPER_VOICE_{lang.upper()}')
+                if not model_path:
+                    raise ValueError(
+                        f"Set ARCHIMEDES_PIPER_VOICE_{lang.upper()} to a "
+                        f"Piper .onnx voice model for {lang!r}"
+                    )
+                _piper_voices[lang] = PiperVoice.load(model_path)
+    return _piper_voices[lang]
+
+# ---------------------------------------------------------------------------
+# Common entry point
+# ---------------------------------------------------------------------------
+
+def synthesize(text, lang='es', backend='gtts', output=None, speaker_wav=None, slow=False):
+    """
+    Synthesize speech from text with the selected backend.
+
+    Args:
+        text: Text to synthesize
+        lang: Language code ('ja' or 'es')
+        backend: 'gtts' (lightweight, network-backed), 'xtts' (Coqui,
+            heavy, local) or 'piper' (lightweight, local CPU - no GPU
+            and no network needed)
+        output: Output file path; defaults to output.mp3 / output.wav
+        speaker_wav: Optional reference wav for voice cloning (xtts only);
+            its conditioning latents are cached on disk for repeat use
+        slow: Use slow reading mode (gtts only)
+
+    Returns the output file path, or None when no text remains after
+    preprocessing.
+    """
+    print(f"Original text: {text}")
+
+    cleaned_text = preprocess_text(text, lang)
+    print(f"Cleaned text: {cleaned_text}")
+
+    if not cleaned_text:
+        print("Warning: No text remaining after preprocessing")
+        return None
+
+    if backend == 'xtts':
+        output = output or 'output.wav'
+        # Get the shared XTTS v2 model (loaded once, reused across calls)
+        print("Loading XTTS v2 model (first call may take a moment)...")
+        tts = _get_tts()
+        print(f"Synthesizing speech to {output}...")
+        _xtts_to_file(tts, cleaned_text, lang, output, speaker_wav)
+    elif backend == 'gtts':
+        output = output or 'output.mp3'
+        print(f"Synthesizing speech to {output}...")
+        data = _fetch_mp3(cleaned_text, lang, slow)
+        Path(output).write_bytes(data)
+    elif backend == 'piper':
+        output = output or 'output.wav'
+        print(f"Synthesizing speech to {output}...")
+        import wave
+        voice = _get_piper_voice(lang)
+        with wave.open(output, 'wb') as wav_file:
+            voice.synthesize_wav(cleaned_text, wav_file)
+    else:
+        raise ValueError(f"Unknown backend: {backend!r}")
+
+    print(f"Success! Audio saved to {output}")
+    return output
+
+# Optionally pre-warm the model at import so a long-running service pays
+# the multi-second weight load / CUDA init at boot instead of on the
+# first user request
+if os.environ.get('ARCHIMEDES_TTS_PREWARM') == '1':
+    threading.Thread(target=_get_tts, daemon=True).start()
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    lang = 'es'
+    backend = 'gtts'
+    if args and args[0] in ('ja', 'es'):
+        lang = args.pop(0)
+    if args and args[0] in ('gtts', 'xtts', 'piper'):
+        backend = args.pop(0)
+
+    if args:
+        # One utterance per argument; '|' also splits within an argument
+        texts = [t.strip() for arg in args for t in arg.split('|') if t.strip()]
+        if backend == 'gtts':
+            synthesize_all(texts, lang)
+        elif backend == 'xtts':
+            synthesize_many(texts, [f'out_{i}.wav' for i in range(len(texts))], lang)
+        else:
+            for i, utterance in enumerate(texts):
+                synthesize(utterance, lang, backend, f'out_{i}.wav')
+    else:
+        print("=" * 60)
+        print("Text-to-Speech Demo")
+        print("=" * 60)
+
+        synthesize("こんにちは！[テスト] これは音声合成のデモです。", lang='ja', backend=backend,
+                   output='output.mp3' if backend == 'gtts' else 'output.wav')
+        synthesize("¡Hola! [Prueba] Esta es una demostración de síntesis de voz.", lang='es',
+                   backend=backend,
+                   output='output_spanish.mp3' if backend == 'gtts' else 'output_spanish.wav')
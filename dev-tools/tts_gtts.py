@@ -0,0 +1,41 @@
+
+#!/usr/bin/env python3
+"""
+Lightweight Japanese/Spanish Text-to-Speech using gTTS
+Thin compatibility shim over the parametric tts module; the gTTS backend
+there keeps the on-disk MP3 cache and the pooled, retrying HTTP session.
+"""
+
+import sys
+
+import tts as _tts
+
+def text_to_speech_japanese(text, output_file='output.mp3', slow=False):
+    """Synthesize Japanese speech via the gTTS backend; see tts.synthesize."""
+    return _tts.synthesize(text, lang='ja', backend='gtts', output=output_file, slow=slow)
+
+def text_to_speech_spanish(text, output_file='output_spanish.mp3', slow=False):
+    """Synthesize Spanish speech via the gTTS backend; see tts.synthesize."""
+    return _tts.synthesize(text, lang='es', backend='gtts', output=output_file, slow=slow)
+
+def synthesize_all(texts, lang='es', max_workers=8):
+    """Concurrent multi-utterance gTTS synthesis; see tts.synthesize_all."""
+    return _tts.synthesize_all(texts, lang, max_workers)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    lang = 'es'
+    if args and args[0] in ('ja', 'es'):
+        lang = args.pop(0)
+
+    if args:
+        # One utterance per argument; '|' also splits within an argument
+        texts = [t.strip() for arg in args for t in arg.split('|') if t.strip()]
+        synthesize_all(texts, lang)
+    else:
+        print("=" * 60)
+        print("gTTS Text-to-Speech Demo")
+        print("=" * 60)
+
+        text_to_speech_japanese("こんにちは！[テスト] これは音声合成のデモです。")
+        text_to_speech_spanish("¡Hola! [Prueba] Esta es una demostración de síntesis de voz.")